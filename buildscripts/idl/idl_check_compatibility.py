@@ -497,6 +497,7 @@ def get_new_commands(
     new_commands: Dict[str, syntax.Command] = dict()
     new_command_file: Dict[str, syntax.IDLParsedSpec] = dict()
     new_command_file_path: Dict[str, str] = dict()
+    new_import_directories = import_directories + [new_idl_dir]
 
     for dirpath, _, filenames in os.walk(new_idl_dir):
         for new_filename in filenames:
@@ -508,7 +509,7 @@ def get_new_commands(
                 new_idl_file = parser.parse(
                     new_file,
                     new_idl_file_path,
-                    CompilerImportResolver(import_directories + [new_idl_dir]),
+                    CompilerImportResolver(new_import_directories),
                     False,
                 )
                 if new_idl_file.errors:
@@ -2108,6 +2109,7 @@ def check_compatibility(
     # Note, a command can be added to V1 at any time, it's ok if a
     # new command has no corresponding old command.
     old_commands: Dict[str, syntax.Command] = dict()
+    old_idl_import_directories = old_import_directories + [old_idl_dir]
     for dirpath, _, filenames in os.walk(old_idl_dir):
         for old_filename in filenames:
             if not old_filename.endswith(".idl") or old_filename in SKIPPED_FILES:
@@ -2118,7 +2120,7 @@ def check_compatibility(
                 old_idl_file = parser.parse(
                     old_file,
                     old_idl_file_path,
-                    CompilerImportResolver(old_import_directories + [old_idl_dir]),
+                    CompilerImportResolver(old_idl_import_directories),
                     False,
                 )
                 if old_idl_file.errors:
@@ -32,10 +32,8 @@ Common error handling code for IDL compatibility checker.
 - Error codes used by the IDL compatibility checker.
 """
 
-import inspect
 import os
-import sys
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # Public error codes used by IDL compatibility checker.
 # Used by tests cases to validate expected errors are thrown in negative tests.
@@ -152,6 +150,8 @@ class IDLCompatibilityError(object):
     - file - a string, the path to the IDL file where the error occurred.
     """
 
+    __slots__ = ("error_id", "command_name", "msg", "old_idl_dir", "new_idl_dir", "file", "_str")
+
     def __init__(
         self,
         error_id: str,
@@ -168,6 +168,8 @@ class IDLCompatibilityError(object):
         self.old_idl_dir = old_idl_dir
         self.new_idl_dir = new_idl_dir
         self.file = file
+        # The formatted error, computed on first use since errors are not modified once created.
+        self._str: Optional[str] = None
 
     def __str__(self) -> str:
         """Return a formatted error.
@@ -177,14 +179,15 @@ class IDLCompatibilityError(object):
         Error in compatibility_test_pass_new/file.idl: ID0001: 'command' has an invalid API
         version '2'.
         """
-        msg = "Comparing %s and %s: Error in %s: %s: %s" % (
-            self.old_idl_dir,
-            self.new_idl_dir,
-            self.file,
-            self.error_id,
-            self.msg,
-        )
-        return msg
+        if self._str is None:
+            self._str = "Comparing %s and %s: Error in %s: %s: %s" % (
+                self.old_idl_dir,
+                self.new_idl_dir,
+                self.file,
+                self.error_id,
+                self.msg,
+            )
+        return self._str
 
 
 class IDLCompatibilityErrorCollection(object):
@@ -193,6 +196,12 @@ class IDLCompatibilityErrorCollection(object):
     def __init__(self) -> None:
         """Initialize IDLCompatibilityErrorCollection."""
         self._errors: List[IDLCompatibilityError] = []
+        # Lookup indexes, built lazily on the first lookup and discarded whenever an error is added.
+        self._errors_by_command_name: Optional[Dict[str, List[IDLCompatibilityError]]] = None
+        self._errors_by_error_id: Optional[Dict[str, List[IDLCompatibilityError]]] = None
+        self._errors_by_command_name_and_error_id: Optional[
+            Dict[Tuple[str, str], List[IDLCompatibilityError]]
+        ] = None
 
     def add(
         self,
@@ -207,6 +216,30 @@ class IDLCompatibilityErrorCollection(object):
         self._errors.append(
             IDLCompatibilityError(error_id, command_name, msg, old_idl_dir, new_idl_dir, file)
         )
+        self._errors_by_command_name = None
+        self._errors_by_error_id = None
+        self._errors_by_command_name_and_error_id = None
+
+    def _build_indexes(self) -> None:
+        """Index the errors by command name and error id in a single pass, preserving order."""
+        by_command_name: Dict[str, List[IDLCompatibilityError]] = {}
+        by_error_id: Dict[str, List[IDLCompatibilityError]] = {}
+        by_command_name_and_error_id: Dict[Tuple[str, str], List[IDLCompatibilityError]] = {}
+        for error in self._errors:
+            by_command_name.setdefault(error.command_name, []).append(error)
+            by_error_id.setdefault(error.error_id, []).append(error)
+            by_command_name_and_error_id.setdefault(
+                (error.command_name, error.error_id), []
+            ).append(error)
+
+        self._errors_by_command_name = by_command_name
+        self._errors_by_error_id = by_error_id
+        self._errors_by_command_name_and_error_id = by_command_name_and_error_id
+
+    def _ensure_indexes(self) -> None:
+        """Build the indexes if errors were added since they were last built."""
+        if self._errors_by_command_name is None:
+            self._build_indexes()
 
     def has_errors(self) -> bool:
         """Have any errors been added to the collection?."""
@@ -214,18 +247,21 @@ class IDLCompatibilityErrorCollection(object):
 
     def contains(self, error_id: str) -> bool:
         """Check if the error collection has at least one message of a given error_id."""
-        return len([a for a in self._errors if a.error_id == error_id]) > 0
+        self._ensure_indexes()
+        return error_id in self._errors_by_error_id
 
     def get_error_by_error_id(self, error_id: str) -> IDLCompatibilityError:
         """Get the first error in the error collection with the id error_id."""
-        error_id_list = [a for a in self._errors if a.error_id == error_id]
+        self._ensure_indexes()
+        error_id_list = self._errors_by_error_id.get(error_id, [])
         error = next(iter(error_id_list), None)
         assert error is not None
         return error
 
     def get_error_by_command_name(self, command_name: str) -> IDLCompatibilityError:
         """Get the first error in the error collection with the command command_name."""
-        command_name_list = [a for a in self._errors if a.command_name == command_name]
+        self._ensure_indexes()
+        command_name_list = self._errors_by_command_name.get(command_name, [])
         error = next(iter(command_name_list), None)
         assert error is not None
         return error
@@ -234,15 +270,16 @@ class IDLCompatibilityErrorCollection(object):
         self, command_name: str, error_id: str
     ) -> IDLCompatibilityError:
         """Get the first error in the error collection from command_name with error_id."""
-        command_name_list = [a for a in self._errors if a.command_name == command_name]
-        error_id_list = [a for a in command_name_list if a.error_id == error_id]
+        self._ensure_indexes()
+        error_id_list = self._errors_by_command_name_and_error_id.get((command_name, error_id), [])
         error = next(iter(error_id_list), None)
         assert error is not None
         return error
 
     def get_all_errors_by_command_name(self, command_name: str) -> List[IDLCompatibilityError]:
         """Get all the errors in the error collection with the command command_name."""
-        return [a for a in self._errors if a.command_name == command_name]
+        self._ensure_indexes()
+        return list(self._errors_by_command_name.get(command_name, []))
 
     def to_list(self) -> List[str]:
         """Return a list of formatted error messages."""
@@ -1780,10 +1817,7 @@ class IDLCompatibilityContext(object):
 
 def _assert_unique_error_messages() -> None:
     """Assert that error codes are unique."""
-    error_ids = []
-    for module_member in inspect.getmembers(sys.modules[__name__]):
-        if module_member[0].startswith("ERROR_ID"):
-            error_ids.append(module_member[1])
+    error_ids = [value for name, value in globals().items() if name.startswith("ERROR_ID")]
 
     error_ids_set = set(error_ids)
     if len(error_ids) != len(error_ids_set):